@@ -1,3 +1,4 @@
+import operator
 import unittest
 
 import numpy as np
@@ -21,60 +22,87 @@ from transformers.tokenization_roberta import RobertaTokenizerFast
 from transformers.tokenization_transfo_xl import TransfoXLTokenizerFast
 
 
+# Outputs compared between python and rust tokenizers
+_COMPARE_KEYS = frozenset({"input_ids", "token_type_ids", "attention_mask"})
+
+
+# (python tokenizer, rust tokenizer, vocab files map key, mismatch threshold, batch overflow raises ValueError)
+_MODELS = {
+    "bert": (BertTokenizer, BertTokenizerFast, "vocab_file", 0.0, False),
+    "transfoxl": (TransfoXLTokenizer, TransfoXLTokenizerFast, "pretrained_vocab_file", 0.0, True),
+    # DistilBert should match 100%
+    "distilbert": (DistilBertTokenizer, DistilBertTokenizerFast, "vocab_file", 0.0, False),
+    "gpt2": (GPT2Tokenizer, GPT2TokenizerFast, "vocab_file", 0.0, True),
+    "roberta": (RobertaTokenizer, RobertaTokenizerFast, "vocab_file", 0.01, False),
+    "openai": (OpenAIGPTTokenizer, OpenAIGPTTokenizerFast, "vocab_file", 0.0, True),
+}
+
+
 class FastTokenizerMatchingTest(unittest.TestCase):
-    def setUp(self) -> None:
-        with open("tests/fixtures/sample_text.txt") as f_data:
-            self._data = f_data.read().replace("\n\n", "\n").strip()
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Clean up the raw bytes so the text is only decoded once
+        with open("tests/fixtures/sample_text.txt", "rb") as f_data:
+            cls._data = f_data.read().replace(b"\n\n", b"\n").strip().decode("utf-8")
 
     def assert_sequence_almost_equals(self, a, b, threshold):
+        a_, b_ = np.asarray(a, dtype=np.int32), np.asarray(b, dtype=np.int32)
 
-        # Handle padding
-        if len(a) != len(b):
-            max_len = max(len(a), len(b))
+        # Any difference fails when no threshold is allowed, sequences of different lengths included
+        if threshold == 0.0:
+            np.testing.assert_array_equal(a_, b_)
+            return
 
+        # Handle padding
+        if len(a_) != len(b_):
             # Pad with a negative number as vocab doesnt allow idx < 0
             # if will be tracked as differences
-            if len(a) < max_len:
-                a += [-1] * (max_len - len(a))
-
-            if len(b) < max_len:
-                b += [-1] * (max_len - len(b))
+            max_len = max(len(a_), len(b_))
+            a_padded = np.full(max_len, -1, dtype=np.int32)
+            a_padded[: len(a_)] = a_
+            b_padded = np.full(max_len, -1, dtype=np.int32)
+            b_padded[: len(b_)] = b_
+            a_, b_ = a_padded, b_padded
 
-        # Convert to numpy for convenience
-        a_, b_ = np.array(a), np.array(b)
-
-        # Compute elementwise difference
-        inputs_diffs = a_ - b_
-        inputs_diff = np.count_nonzero(inputs_diffs)
-        self.assertLessEqual(inputs_diff / a_.shape[0], threshold)
+        # Count elementwise differences
+        inputs_diff = np.count_nonzero(np.not_equal(a_, b_))
+        self.assertLessEqual(inputs_diff / len(a_), threshold)
 
     def assert_tokenization_python_rust_almost_equals(self, tokenizer_p, tokenizer_r, threshold: float):
+        # Single and pair inputs are encoded together so the rust tokenizer handles them in one call
+        batch = [self._data, (self._data, self._data)]
+
         # Ensure basic input match
-        input_p = tokenizer_p.encode_plus(self._data)
-        input_r = tokenizer_r.encode_plus(self._data)
+        input_p = tokenizer_p.batch_encode_plus(batch, add_special_tokens=True)
+        input_r = tokenizer_r.batch_encode_plus(batch, add_special_tokens=True)
 
-        for key in filter(lambda x: x in ["input_ids", "token_type_ids", "attention_mask"], input_p.keys()):
-            self.assert_sequence_almost_equals(input_p[key], input_r[key], threshold)
+        # All the variants below return the same set of compared keys
+        compare_keys = tuple(_COMPARE_KEYS & input_p.keys())
 
-        input_pairs_p = tokenizer_p.encode_plus(self._data, self._data)
-        input_pairs_r = tokenizer_r.encode_plus(self._data, self._data)
+        for key in compare_keys:
+            for sequence_p, sequence_r in zip(input_p[key], input_r[key]):
+                self.assert_sequence_almost_equals(sequence_p, sequence_r, threshold)
 
-        for key in filter(lambda x: x in ["input_ids", "token_type_ids", "attention_mask"], input_p.keys()):
-            self.assert_sequence_almost_equals(input_pairs_p[key], input_pairs_r[key], threshold)
+        # Truncation variants would give the same output as above for inputs already fitting in max_length
+        single_length = len(input_r["input_ids"][0])
 
         # Ensure truncation match
-        input_p = tokenizer_p.encode_plus(self._data, max_length=512)
-        input_r = tokenizer_r.encode_plus(self._data, max_length=512)
+        if single_length > 512:
+            input_p = tokenizer_p.encode_plus(self._data, max_length=512)
+            input_r = tokenizer_r.encode_plus(self._data, max_length=512)
 
-        for key in filter(lambda x: x in ["input_ids", "token_type_ids", "attention_mask"], input_p.keys()):
-            self.assert_sequence_almost_equals(input_p[key], input_r[key], threshold)
+            for key in compare_keys:
+                self.assert_sequence_almost_equals(input_p[key], input_r[key], threshold)
 
         # Ensure truncation with stride match
-        input_p = tokenizer_p.encode_plus(self._data, max_length=512, stride=3, return_overflowing_tokens=True)
-        input_r = tokenizer_r.encode_plus(self._data, max_length=512, stride=3, return_overflowing_tokens=True)
+        # batch_encode_plus on fast tokenizers flattens the overflowing windows of every sample while the python
+        # implementation only returns the truncated sequence, so this one is compared through encode_plus.
+        if single_length > 512:
+            input_p = tokenizer_p.encode_plus(self._data, max_length=512, stride=3, return_overflowing_tokens=True)
+            input_r = tokenizer_r.encode_plus(self._data, max_length=512, stride=3, return_overflowing_tokens=True)
 
-        for key in filter(lambda x: x in ["input_ids", "token_type_ids", "attention_mask"], input_p.keys()):
-            self.assert_sequence_almost_equals(input_p[key], input_r[key], threshold)
+            for key in compare_keys:
+                self.assert_sequence_almost_equals(input_p[key], input_r[key], threshold)
 
     def assert_add_tokens(self, tokenizer_r):
         vocab_size = tokenizer_r.vocab_size
@@ -97,31 +125,21 @@ class FastTokenizerMatchingTest(unittest.TestCase):
         text = "Wonderful no inspiration example with subtoken"
         pair = "Along with an awesome pair"
 
-        # No pair
-        tokens_with_offsets = tokenizer.encode_plus(text, return_special_tokens_mask=True, return_offsets_mapping=True)
-        added_tokens = tokenizer.num_added_tokens(False)
-        offsets = tokens_with_offsets["offset_mapping"]
-
-        # Assert there is the same number of tokens and offsets
-        self.assertEqual(len(offsets), len(tokens_with_offsets["input_ids"]))
-
-        # Assert there is online added_tokens special_tokens
-        self.assertEqual(sum([0 if x else 1 for x in offsets]), added_tokens)
-        self.assertEqual(sum(tokens_with_offsets["special_tokens_mask"]), added_tokens)
-
-        # Pairs
-        tokens_with_offsets = tokenizer.encode_plus(
-            text, pair, return_special_tokens_mask=True, return_offsets_mapping=True
+        # No pair and pair inputs are encoded in a single call
+        tokens_with_offsets = tokenizer.batch_encode_plus(
+            [text, (text, pair)], return_special_tokens_mask=True, return_offsets_mapping=True
         )
-        added_tokens = tokenizer.num_added_tokens(True)
-        offsets = tokens_with_offsets["offset_mapping"]
 
-        # Assert there is the same number of tokens and offsets
-        self.assertEqual(len(offsets), len(tokens_with_offsets["input_ids"]))
+        for i, is_pair in enumerate((False, True)):
+            added_tokens = tokenizer.num_added_tokens(is_pair)
+            offsets = tokens_with_offsets["offset_mapping"][i]
+
+            # Assert there is the same number of tokens and offsets
+            self.assertEqual(len(offsets), len(tokens_with_offsets["input_ids"][i]))
 
-        # Assert there is online added_tokens special_tokens
-        self.assertEqual(sum([0 if x else 1 for x in offsets]), added_tokens)
-        self.assertEqual(sum(tokens_with_offsets["special_tokens_mask"]), added_tokens)
+            # Assert there is online added_tokens special_tokens
+            self.assertEqual(sum(map(operator.not_, offsets)), added_tokens)
+            self.assertEqual(sum(tokens_with_offsets["special_tokens_mask"][i]), added_tokens)
 
     def assert_batch_encode_dynamic_overflowing(self, tokenizer: PreTrainedTokenizer):
         """
@@ -173,245 +191,86 @@ class FastTokenizerMatchingTest(unittest.TestCase):
             self.assertEqual(tokens[key].shape[-1], 6)
 
     def assert_build_inputs_with_special_tokens(self, tokenizer_r, tokenizer_p):
-        # Input string
-        input_simple = tokenizer_p.tokenize("This is a sample input")
-        input_pair = tokenizer_p.tokenize("This is a sample pair")
-
-        # Generate output
-        output_r = tokenizer_r.build_inputs_with_special_tokens(input_simple)
-        output_p = tokenizer_p.build_inputs_with_special_tokens(input_simple)
-        self.assertEqual(output_p, output_r)
-
-        # Generate pair output
-        output_r = tokenizer_r.build_inputs_with_special_tokens(input_simple, input_pair)
-        output_p = tokenizer_p.build_inputs_with_special_tokens(input_simple, input_pair)
-        self.assertEqual(output_p, output_r)
-
-        # Input tokens id
-        input_simple = tokenizer_p.encode("This is a sample input")
-        input_pair = tokenizer_p.encode("This is a sample pair")
-
-        # Generate output
-        output_r = tokenizer_r.build_inputs_with_special_tokens(input_simple)
-        output_p = tokenizer_p.build_inputs_with_special_tokens(input_simple)
-        self.assertEqual(output_p, output_r)
-
-        # Generate pair output
-        output_r = tokenizer_r.build_inputs_with_special_tokens(input_simple, input_pair)
-        output_p = tokenizer_p.build_inputs_with_special_tokens(input_simple, input_pair)
-        self.assertEqual(output_p, output_r)
-
-    def test_bert(self):
-        for tokenizer_name in BertTokenizer.pretrained_vocab_files_map["vocab_file"].keys():
-            tokenizer_p = BertTokenizer.from_pretrained(tokenizer_name)
-            tokenizer_r = BertTokenizerFast.from_pretrained(tokenizer_name)
+        # Input strings, both as tokens and as tokens id
+        tokens_simple = tokenizer_p.tokenize("This is a sample input")
+        tokens_pair = tokenizer_p.tokenize("This is a sample pair")
+        ids_simple = tokenizer_p.encode("This is a sample input")
+        ids_pair = tokenizer_p.encode("This is a sample pair")
+
+        for input_simple, input_pair in ((tokens_simple, tokens_pair), (ids_simple, ids_pair)):
+            # Generate output
+            output_r = tokenizer_r.build_inputs_with_special_tokens(input_simple)
+            output_p = tokenizer_p.build_inputs_with_special_tokens(input_simple)
+            self.assertEqual(output_p, output_r)
+
+            # Generate pair output
+            output_r = tokenizer_r.build_inputs_with_special_tokens(input_simple, input_pair)
+            output_p = tokenizer_p.build_inputs_with_special_tokens(input_simple, input_pair)
+            self.assertEqual(output_p, output_r)
+
+    def _check_one(self, tokenizer_name, py_cls, fast_cls, threshold, batch_overflow_raises):
+        tokenizer_p = py_cls.from_pretrained(tokenizer_name)
+        tokenizer_r = fast_cls.from_pretrained(tokenizer_name)
+
+        # Check we have the same number of added_tokens for both pair and non-pair inputs.
+        self.assertEqual(tokenizer_r.num_added_tokens(False), tokenizer_p.num_added_tokens(False))
+        self.assertEqual(tokenizer_r.num_added_tokens(True), tokenizer_p.num_added_tokens(True))
+
+        # Check we have the correct max_length for both pair and non-pair inputs.
+        self.assertEqual(tokenizer_r.max_len_single_sentence, tokenizer_p.max_len_single_sentence)
+        self.assertEqual(tokenizer_r.max_len_sentences_pair, tokenizer_p.max_len_sentences_pair)
+
+        # Assert the set of special tokens match.
+        self.assertDictEqual(
+            tokenizer_p.special_tokens_map,
+            tokenizer_r.special_tokens_map,
+            "{} tokenizers doesn't have the same set of special_tokens".format(py_cls.__name__),
+        )
 
-            # Check we have the same number of added_tokens for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.num_added_tokens(False), tokenizer_p.num_added_tokens(False))
-            self.assertEqual(tokenizer_r.num_added_tokens(True), tokenizer_p.num_added_tokens(True))
+        # Assure tokenization overlap between python and rust impl.
+        self.assert_tokenization_python_rust_almost_equals(tokenizer_p, tokenizer_r, threshold)
 
-            # Check we have the correct max_length for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.max_len_single_sentence, tokenizer_p.max_len_single_sentence)
-            self.assertEqual(tokenizer_r.max_len_sentences_pair, tokenizer_p.max_len_sentences_pair)
+        # Ensure add_tokens and add_special_tokens return the correct vocab size
+        self.assert_add_tokens(tokenizer_r)
 
-            # Assert the set of special tokens match.
-            self.assertSequenceEqual(
-                tokenizer_p.special_tokens_map.items(),
-                tokenizer_r.special_tokens_map.items(),
-                "Bert tokenizers doesn't have the same set of special_tokens",
-            )
+        # Check for offsets mapping
+        self.assert_offsets_mapping(tokenizer_r)
 
-            # Assure tokenization overlap between python and rust impl.
-            self.assert_tokenization_python_rust_almost_equals(tokenizer_p, tokenizer_r, 0.0)
+        # Check for dynamic encoding sequence handling in batch_encode_plus
+        if batch_overflow_raises:
+            self.assertRaises(ValueError, self.assert_batch_encode_dynamic_overflowing, tokenizer_r)
+        else:
+            self.assert_batch_encode_dynamic_overflowing(tokenizer_r)
 
-            # Ensure add_tokens and add_special_tokens return the correct vocab size
-            self.assert_add_tokens(tokenizer_r)
+        # Check alignment for build_inputs_with_special_tokens
+        self.assert_build_inputs_with_special_tokens(tokenizer_r, tokenizer_p)
 
-            # Check for offsets mapping
-            self.assert_offsets_mapping(tokenizer_r)
+    def _run_suite(self, model):
+        py_cls, fast_cls, vocab_key, threshold, batch_overflow_raises = _MODELS[model]
 
-            # Check for dynamic encoding sequence handling in batch_encode_plus
-            self.assert_batch_encode_dynamic_overflowing(tokenizer_r)
+        # Each checkpoint is reported as its own sub test so a failing one does not hide the others
+        for tokenizer_name in py_cls.pretrained_vocab_files_map[vocab_key].keys():
+            with self.subTest(tokenizer_name=tokenizer_name):
+                self._check_one(tokenizer_name, py_cls, fast_cls, threshold, batch_overflow_raises)
 
-            # Check alignment for build_inputs_with_special_tokens
-            self.assert_build_inputs_with_special_tokens(tokenizer_r, tokenizer_p)
+    def test_bert(self):
+        self._run_suite("bert")
 
     @require_torch
     def test_transfoxl(self):
-        for tokenizer_name in TransfoXLTokenizer.pretrained_vocab_files_map["pretrained_vocab_file"].keys():
-            tokenizer_p = TransfoXLTokenizer.from_pretrained(tokenizer_name)
-            tokenizer_r = TransfoXLTokenizerFast.from_pretrained(tokenizer_name)
-
-            # Check we have the same number of added_tokens for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.num_added_tokens(False), tokenizer_p.num_added_tokens(False))
-            self.assertEqual(tokenizer_r.num_added_tokens(True), tokenizer_p.num_added_tokens(True))
-
-            # Check we have the correct max_length for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.max_len_single_sentence, tokenizer_p.max_len_single_sentence)
-            self.assertEqual(tokenizer_r.max_len_sentences_pair, tokenizer_p.max_len_sentences_pair)
-
-            # Assert the set of special tokens match.
-            self.assertSequenceEqual(
-                tokenizer_p.special_tokens_map.items(),
-                tokenizer_r.special_tokens_map.items(),
-                "TransfoXL tokenizers doesn't have the same set of special_tokens",
-            )
-
-            # Assure tokenization overlap between python and rust impl.
-            self.assert_tokenization_python_rust_almost_equals(tokenizer_p, tokenizer_r, 0.0)
-
-            # Ensure add_tokens and add_special_tokens return the correct vocab size
-            self.assert_add_tokens(tokenizer_r)
-
-            # Check for offsets mapping
-            self.assert_offsets_mapping(tokenizer_r)
-
-            # Check for dynamic encoding sequence handling in batch_encode_plus
-            self.assertRaises(ValueError, self.assert_batch_encode_dynamic_overflowing, tokenizer_r)
-
-            # Check alignment for build_inputs_with_special_tokens
-            self.assert_build_inputs_with_special_tokens(tokenizer_r, tokenizer_p)
+        self._run_suite("transfoxl")
 
     def test_distilbert(self):
-        for tokenizer_name in DistilBertTokenizer.pretrained_vocab_files_map["vocab_file"].keys():
-            tokenizer_p = DistilBertTokenizer.from_pretrained(tokenizer_name)
-            tokenizer_r = DistilBertTokenizerFast.from_pretrained(tokenizer_name)
-
-            # Check we have the same number of added_tokens for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.num_added_tokens(False), tokenizer_p.num_added_tokens(False))
-            self.assertEqual(tokenizer_r.num_added_tokens(True), tokenizer_p.num_added_tokens(True))
-
-            # Check we have the correct max_length for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.max_len_single_sentence, tokenizer_p.max_len_single_sentence)
-            self.assertEqual(tokenizer_r.max_len_sentences_pair, tokenizer_p.max_len_sentences_pair)
-
-            # DistilBert should match 100%
-            # Assert the set of special tokens match.
-            self.assertSequenceEqual(
-                tokenizer_p.special_tokens_map.items(),
-                tokenizer_r.special_tokens_map.items(),
-                "DistilBert tokenizers doesn't have the same set of special_tokens",
-            )
-
-            # Assure tokenization overlap between python and rust impl.
-            self.assert_tokenization_python_rust_almost_equals(tokenizer_p, tokenizer_r, 0.0)
-
-            # Ensure add_tokens and add_special_tokens return the correct vocab size
-            self.assert_add_tokens(tokenizer_r)
-
-            # Check for offsets mapping
-            self.assert_offsets_mapping(tokenizer_r)
-
-            # Check for dynamic encoding sequence handling in batch_encode_plus
-            self.assert_batch_encode_dynamic_overflowing(tokenizer_r)
-
-            # Check alignment for build_inputs_with_special_tokens
-            self.assert_build_inputs_with_special_tokens(tokenizer_r, tokenizer_p)
+        self._run_suite("distilbert")
 
     def test_gpt2(self):
-        for tokenizer_name in GPT2Tokenizer.pretrained_vocab_files_map["vocab_file"].keys():
-            tokenizer_p = GPT2Tokenizer.from_pretrained(tokenizer_name)
-            tokenizer_r = GPT2TokenizerFast.from_pretrained(tokenizer_name)
-
-            # Check we have the same number of added_tokens for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.num_added_tokens(False), tokenizer_p.num_added_tokens(False))
-            self.assertEqual(tokenizer_r.num_added_tokens(True), tokenizer_p.num_added_tokens(True))
-
-            # Check we have the correct max_length for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.max_len_single_sentence, tokenizer_p.max_len_single_sentence)
-            self.assertEqual(tokenizer_r.max_len_sentences_pair, tokenizer_p.max_len_sentences_pair)
-
-            # Assert the set of special tokens match.
-            self.assertSequenceEqual(
-                tokenizer_p.special_tokens_map.items(),
-                tokenizer_r.special_tokens_map.items(),
-                "GPT2 tokenizers doesn't have the same set of special_tokens",
-            )
-
-            # Assure tokenization overlap between python and rust impl.
-            self.assert_tokenization_python_rust_almost_equals(tokenizer_p, tokenizer_r, 0.0)
-
-            # Ensure add_tokens and add_special_tokens return the correct vocab size
-            self.assert_add_tokens(tokenizer_r)
-
-            # Check for offsets mapping
-            self.assert_offsets_mapping(tokenizer_r)
-
-            # Check for dynamic encoding sequence handling in batch_encode_plus
-            self.assertRaises(ValueError, self.assert_batch_encode_dynamic_overflowing, tokenizer_r)
-
-            # Check alignment for build_inputs_with_special_tokens
-            self.assert_build_inputs_with_special_tokens(tokenizer_r, tokenizer_p)
+        self._run_suite("gpt2")
 
     def test_roberta(self):
-        for tokenizer_name in RobertaTokenizer.pretrained_vocab_files_map["vocab_file"].keys():
-            tokenizer_p = RobertaTokenizer.from_pretrained(tokenizer_name)
-            tokenizer_r = RobertaTokenizerFast.from_pretrained(tokenizer_name)
-
-            # Check we have the same number of added_tokens for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.num_added_tokens(False), tokenizer_p.num_added_tokens(False))
-            self.assertEqual(tokenizer_r.num_added_tokens(True), tokenizer_p.num_added_tokens(True))
-
-            # Check we have the correct max_length for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.max_len_single_sentence, tokenizer_p.max_len_single_sentence)
-            self.assertEqual(tokenizer_r.max_len_sentences_pair, tokenizer_p.max_len_sentences_pair)
-
-            # Assert the set of special tokens match.
-            self.assertSequenceEqual(
-                tokenizer_p.special_tokens_map.items(),
-                tokenizer_r.special_tokens_map.items(),
-                "Roberta tokenizers doesn't have the same set of special_tokens",
-            )
-
-            # Assure tokenization overlap between python and rust impl.
-            self.assert_tokenization_python_rust_almost_equals(tokenizer_p, tokenizer_r, 0.01)
-
-            # Ensure add_tokens and add_special_tokens return the correct vocab size
-            self.assert_add_tokens(tokenizer_r)
-
-            # Check for offsets mapping
-            self.assert_offsets_mapping(tokenizer_r)
-
-            # Check for dynamic encoding sequence handling in batch_encode_plus
-            self.assert_batch_encode_dynamic_overflowing(tokenizer_r)
-
-            # Check alignment for build_inputs_with_special_tokens
-            self.assert_build_inputs_with_special_tokens(tokenizer_r, tokenizer_p)
+        self._run_suite("roberta")
 
     def test_openai(self):
-        for tokenizer_name in OpenAIGPTTokenizer.pretrained_vocab_files_map["vocab_file"].keys():
-            tokenizer_p = OpenAIGPTTokenizer.from_pretrained(tokenizer_name)
-            tokenizer_r = OpenAIGPTTokenizerFast.from_pretrained(tokenizer_name)
-
-            # Check we have the same number of added_tokens for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.num_added_tokens(False), tokenizer_p.num_added_tokens(False))
-            self.assertEqual(tokenizer_r.num_added_tokens(True), tokenizer_p.num_added_tokens(True))
-
-            # Check we have the correct max_length for both pair and non-pair inputs.
-            self.assertEqual(tokenizer_r.max_len_single_sentence, tokenizer_p.max_len_single_sentence)
-            self.assertEqual(tokenizer_r.max_len_sentences_pair, tokenizer_p.max_len_sentences_pair)
-
-            # Assert the set of special tokens match.
-            self.assertSequenceEqual(
-                tokenizer_p.special_tokens_map.items(),
-                tokenizer_r.special_tokens_map.items(),
-                "GPT tokenizers doesn't have the same set of special_tokens",
-            )
-
-            # Assure tokenization overlap between python and rust impl.
-            self.assert_tokenization_python_rust_almost_equals(tokenizer_p, tokenizer_r, 0.0)
-
-            # Ensure add_tokens and add_special_tokens return the correct vocab size
-            self.assert_add_tokens(tokenizer_r)
-
-            # Check for offsets mapping
-            self.assert_offsets_mapping(tokenizer_r)
-
-            # Check for dynamic encoding sequence handling in batch_encode_plus
-            self.assertRaises(ValueError, self.assert_batch_encode_dynamic_overflowing, tokenizer_r)
-
-            # Check alignment for build_inputs_with_special_tokens
-            self.assert_build_inputs_with_special_tokens(tokenizer_r, tokenizer_p)
+        self._run_suite("openai")
 
 
 if __name__ == "__main__":